@@ -4,9 +4,45 @@ Loads, processes, and groups messages into conversations.
 """
 import json
 import os
-from typing import Dict, List, Any
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; without it files are parsed whole
+    ijson = None
+
+# Read buffer size for export files
+_READ_BUFFER_SIZE = 64 * 1024
+
+# Gap in seconds allowed between messages until a second sender joins in
+_EXTENDED_THRESHOLD_SECONDS = 60
+
+# Instagram's generic attachment placeholders, stripped and lower-cased
+_ATTACHMENT_MARKERS = frozenset({
+    'enviaste un archivo adjunto.',
+    'you sent an attachment.',
+})
+_ATTACHMENT_MARKER_MAX_LEN = max(len(marker) for marker in _ATTACHMENT_MARKERS)
+
+# Top-level message fields used for parsing; ingested messages keep only these
+_MESSAGE_FIELDS = ('sender_name', 'timestamp_ms', 'content')
+
+# Errors raised by the available JSON backends for malformed files
+_JSON_ERRORS = (json.JSONDecodeError,) + ((ijson.JSONError,) if ijson is not None else ())
+
+# JSON parser for raw file bytes, chosen once and shared by every file load.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers only need
+# to handle the latter.
+_loads = orjson.loads if orjson is not None else json.loads
+
 
 class MessageParser:
     """
@@ -25,51 +61,173 @@ class MessageParser:
                          to Instagram usernames
         """
         self.user_mapping = user_mapping or {}
+        # Lower-cased Instagram username -> role; the first matching role wins
+        self._role_by_username = {}
+        for role, instagram_user in self.user_mapping.items():
+            self._role_by_username.setdefault(instagram_user.lower(), sys.intern(role))
+        # Raw sender_name -> interned resolved label, filled in as senders are seen
+        self._resolved_usernames = {}
         self.messages_data = None
         self.conversations = []
+        # Grouping options used when conversations are produced lazily, and
+        # whether parse_conversations has stored its result
+        self._parse_options = {}
+        self._conversations_stored = False
         
-    def load_messages(self, filepath: str) -> None:
+    def load_messages(self, filepath: str, stream: bool = False) -> None:
         """
         Load messages from JSON file or folder containing multiple JSON files.
         
         Args:
             filepath: Path to a messages.json file or folder containing multiple .json files
+            stream: If True, read the files one message at a time and keep only
+                    the fields used for parsing (see ingest_message), so large
+                    exports are never held in memory in full (default: False)
         """
+        if stream:
+            self._stream_messages(filepath)
+            return
+        
         # Check if filepath is a directory
         if os.path.isdir(filepath):
             # Load all JSON files from the directory
             all_messages = []
-            json_files = [f for f in os.listdir(filepath) if f.endswith('.json')]
-            
-            if not json_files:
-                raise FileNotFoundError(f"No JSON files found in {filepath}")
-            
-            for json_file in sorted(json_files):
-                file_path = os.path.join(filepath, json_file)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        file_data = json.load(f)
-                        # Fix Instagram's encoding issue
-                        file_data = self._fix_encoding(file_data)
-                        # Handle both single message objects and arrays of messages
-                        if isinstance(file_data, dict) and 'messages' in file_data:
-                            all_messages.extend(file_data['messages'])
-                        elif isinstance(file_data, list):
-                            all_messages.extend(file_data)
-                        else:
-                            # Assume it's a single message object
-                            all_messages.append(file_data)
-                except (json.JSONDecodeError, KeyError) as e:
-                    print(f"Warning: Error loading {json_file}: {e}")
-                    continue
+            json_files = self._list_json_files(filepath)
+            # Parse files concurrently; results are collected in filename order
+            max_workers = min(len(json_files), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(self._read_messages, os.path.join(filepath, json_file))
+                    for json_file in json_files
+                ]
+                for json_file, future in zip(json_files, futures):
+                    try:
+                        all_messages.extend(future.result())
+                    except _JSON_ERRORS + (KeyError,) as e:
+                        print(f"Warning: Error loading {json_file}: {e}")
+                        continue
             
             # Create a combined messages structure
             self.messages_data = {'messages': all_messages}
         else:
             # Load single file
-            with open(filepath, 'r', encoding='utf-8') as f:
-                self.messages_data = json.load(f)
-                self.messages_data = self._fix_encoding(self.messages_data)
+            with open(filepath, 'rb') as f:
+                self.messages_data = _loads(f.read())
+            self.messages_data = self._fix_encoding(self.messages_data)
+    
+    def _list_json_files(self, folder: str) -> List[str]:
+        """
+        List the JSON files in an export folder, sorted by name.
+        
+        Args:
+            folder: Path to the folder
+            
+        Returns:
+            Sorted list of .json file names
+        """
+        json_files = [f for f in os.listdir(folder) if f.endswith('.json')]
+        if not json_files:
+            raise FileNotFoundError(f"No JSON files found in {folder}")
+        json_files.sort()
+        return json_files
+    
+    def _stream_messages(self, filepath: str) -> None:
+        """
+        Load messages from a file or folder one message at a time.
+        
+        Files are read in name order and every message is passed to
+        ingest_message as soon as it is parsed. As with load_messages, a
+        malformed file in a folder is reported and skipped as a whole.
+        
+        Args:
+            filepath: Path to a messages.json file or folder containing multiple .json files
+        """
+        self.messages_data = {'messages': []}
+        messages = self.messages_data['messages']
+        
+        if not os.path.isdir(filepath):
+            for message in self._iter_file_messages(filepath):
+                self.ingest_message(message)
+            return
+        
+        for json_file in self._list_json_files(filepath):
+            start = len(messages)
+            try:
+                for message in self._iter_file_messages(os.path.join(filepath, json_file)):
+                    self.ingest_message(message)
+            except _JSON_ERRORS + (KeyError,) as e:
+                # Drop whatever was read before the error
+                del messages[start:]
+                print(f"Warning: Error loading {json_file}: {e}")
+    
+    def ingest_message(self, message: Dict[str, Any]) -> None:
+        """
+        Add one raw exported message to the loaded messages.
+        
+        Only the fields used for parsing (sender, timestamp, content and
+        shared text) are kept, and only those have their encoding fixed;
+        reactions, media references and other fields are dropped.
+        
+        Args:
+            message: Message object as it appears in the export file
+        """
+        if self.messages_data is None:
+            self.messages_data = {'messages': []}
+        
+        fix_encoding = self._fix_encoding
+        kept = {key: fix_encoding(message[key]) for key in _MESSAGE_FIELDS if key in message}
+        share = message.get('share')
+        if isinstance(share, dict) and 'share_text' in share:
+            kept['share'] = {'share_text': fix_encoding(share['share_text'])}
+        self.messages_data['messages'].append(kept)
+    
+    def _read_messages(self, file_path: str) -> List[Any]:
+        """
+        Read the messages contained in a single export file.
+        
+        Args:
+            file_path: Path to a .json export file
+            
+        Returns:
+            List of messages with fixed encoding
+        """
+        # Fix Instagram's encoding issue
+        return [self._fix_encoding(msg) for msg in self._iter_file_messages(file_path)]
+    
+    def _iter_file_messages(self, file_path: str) -> Iterator[Any]:
+        """
+        Yield the raw messages contained in a single export file.
+        
+        When ijson is installed, the 'messages' array is streamed one message
+        at a time so the whole document is never held in memory. Files with
+        any other layout (a bare list or a single message object) are parsed
+        in full.
+        
+        Args:
+            file_path: Path to a .json export file
+            
+        Yields:
+            Messages as stored in the file, without encoding fixes
+        """
+        if ijson is not None:
+            found = False
+            with open(file_path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+                for msg in ijson.items(f, 'messages.item', use_float=True):
+                    found = True
+                    yield msg
+            if found:
+                return
+        
+        with open(file_path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+            file_data = _loads(f.read())
+        # Handle both single message objects and arrays of messages
+        if isinstance(file_data, dict) and 'messages' in file_data:
+            yield from file_data['messages']
+        elif isinstance(file_data, list):
+            yield from file_data
+        else:
+            # Assume it's a single message object
+            yield file_data
     
     def _fix_encoding(self, obj):
         """
@@ -82,6 +240,9 @@ class MessageParser:
             Object with fixed encoding
         """
         if isinstance(obj, str):
+            # ASCII text is unchanged by the round-trip below, so skip it
+            if obj.isascii():
+                return obj
             # Try to fix the encoding by encoding as latin1 and decoding as utf-8
             try:
                 return obj.encode('latin1').decode('utf-8')
@@ -104,43 +265,83 @@ class MessageParser:
         Returns:
             Role label if found in mapping, otherwise original username
         """
-        for role, instagram_user in self.user_mapping.items():
-            if instagram_user.lower() == username.lower():
-                return role
-        return username
+        resolved = self._resolved_usernames.get(username)
+        if resolved is None:
+            resolved = sys.intern(self._role_by_username.get(username.lower(), username))
+            self._resolved_usernames[username] = resolved
+        return resolved
     
-    def _should_group_messages(self, msg1: Dict[str, Any], msg2: Dict[str, Any], 
-                               time_threshold_seconds: int = 30,
-                               conversation: List[Dict[str, Any]] = None) -> bool:
+    def _format_timestamp(self, timestamp_ms: int) -> Optional[str]:
         """
-        Determine if two messages should be grouped in the same conversation.
+        Format a millisecond timestamp as a local-time ISO 8601 string.
         
         Args:
-            msg1: First message
-            msg2: Second message
-            time_threshold_seconds: Maximum time difference in seconds (default: 30)
-            conversation: Current conversation to check for interchange
+            timestamp_ms: Timestamp in milliseconds
             
         Returns:
-            True if messages should be grouped, False otherwise
+            ISO formatted timestamp, or None if the message has no timestamp
         """
-        # Get timestamps in milliseconds
-        ts1 = msg1.get('timestamp_ms', 0)
-        ts2 = msg2.get('timestamp_ms', 0)
+        if not timestamp_ms:
+            return None
+        return datetime.fromtimestamp(timestamp_ms / 1000.0).isoformat()
+    
+    def _find_conversation_spans(self, timestamps: List[int], sender_ids: List[int],
+                                 time_threshold_seconds: int = 30,
+                                 interchange_only: bool = True,
+                                 max_messages: int = 10) -> List[slice]:
+        """
+        Find the conversations in a chronological run of messages.
         
-        # Calculate time difference in seconds
-        time_diff = abs(ts2 - ts1) / 1000.0
+        Works on plain timestamp and sender id lists in a single pass, so the
+        per-message loop only does integer comparisons, with no dict lookups
+        or sets. A new conversation starts when the gap to the previous
+        message exceeds the threshold (the extended threshold until a second
+        sender appears) or when the current conversation already holds
+        max_messages messages. Conversations that fail the interchange filter
+        are dropped as they close.
         
-        # Check if there's an interchange (at least 2 different senders)
-        has_interchange = False
-        if conversation:
-            senders = set(msg['sender'] for msg in conversation)
-            has_interchange = len(senders) > 1
+        Args:
+            timestamps: Message timestamps in milliseconds, sorted ascending
+            sender_ids: Interned sender id of each message
+            time_threshold_seconds: Maximum time difference in seconds (default: 30)
+            interchange_only: If True, only keep conversations with at least 2 different senders (default: True)
+            max_messages: Maximum number of messages per conversation (default: 10)
+            
+        Returns:
+            List of slices into the message lists, one per kept conversation
+        """
+        spans = []
+        if not timestamps:
+            return spans
         
-        # Use extended threshold (60 seconds) if there's no interchange yet
-        threshold = time_threshold_seconds if has_interchange else 60
+        # Compare gaps in integer milliseconds; the extended threshold applies
+        # until a second sender joins the conversation
+        threshold_ms = time_threshold_seconds * 1000
+        extended_ms = _EXTENDED_THRESHOLD_SECONDS * 1000
         
-        return time_diff <= threshold
+        start = 0
+        first_sender = sender_ids[0]
+        has_interchange = False
+        threshold = extended_ms
+        last_ts = timestamps[0]
+        
+        for i in range(1, len(timestamps)):
+            ts = timestamps[i]
+            if i - start >= max_messages or ts - last_ts > threshold:
+                if has_interchange or not interchange_only:
+                    spans.append(slice(start, i))
+                start = i
+                first_sender = sender_ids[i]
+                has_interchange = False
+                threshold = extended_ms
+            elif not has_interchange and sender_ids[i] != first_sender:
+                has_interchange = True
+                threshold = threshold_ms
+            last_ts = ts
+        
+        if has_interchange or not interchange_only:
+            spans.append(slice(start, len(timestamps)))
+        return spans
     
     def parse_conversations(self, time_threshold_seconds: int = 30, 
                           interchange_only: bool = True,
@@ -167,31 +368,144 @@ class MessageParser:
         if not self.messages_data:
             return []
         
-        messages = self.messages_data.get('messages', [])
+        self.set_parse_options(time_threshold_seconds, interchange_only, max_messages,
+                               group_consecutive, consecutive_separator)
+        conversations = list(self._generate_conversations(**self._parse_options))
+        self.conversations = conversations
+        self._conversations_stored = True
+        return conversations
+    
+    def set_parse_options(self, time_threshold_seconds: int = 30,
+                          interchange_only: bool = True,
+                          max_messages: int = 10,
+                          group_consecutive: bool = False,
+                          consecutive_separator: str = ', ') -> None:
+        """
+        Set the grouping options without parsing the messages yet.
         
-        # Sort messages by timestamp (oldest first for chronological order)
-        sorted_messages = sorted(messages, key=lambda x: x.get('timestamp_ms', 0))
+        Conversations are then produced lazily by iter_conversations, which
+        groups the loaded messages again on every call instead of keeping the
+        conversations in memory. Discards conversations stored by an earlier
+        parse_conversations call.
         
-        if not sorted_messages:
-            return []
+        Args:
+            time_threshold_seconds: Maximum time difference in seconds for grouping (default: 30)
+            interchange_only: If True, only include conversations with at least 2 different senders (default: True)
+            max_messages: Maximum number of messages per conversation (default: 10)
+            group_consecutive: If True, group consecutive messages from the same sender (default: False)
+            consecutive_separator: Separator for grouped consecutive messages (default: ', ')
+        """
+        self._parse_options = {
+            'time_threshold_seconds': time_threshold_seconds,
+            'interchange_only': interchange_only,
+            'max_messages': max_messages,
+            'group_consecutive': group_consecutive,
+            'consecutive_separator': consecutive_separator,
+        }
+        self.conversations = []
+        self._conversations_stored = False
+    
+    def iter_conversations(self, time_threshold_seconds: Optional[int] = None,
+                           interchange_only: Optional[bool] = None,
+                           max_messages: Optional[int] = None,
+                           group_consecutive: Optional[bool] = None,
+                           consecutive_separator: Optional[str] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield conversations one at a time.
         
-        conversations = []
-        current_conversation = []
+        Without arguments, yields the conversations stored by
+        parse_conversations, or groups the loaded messages with the options
+        from set_parse_options (or the defaults) as it goes. Any argument
+        given overrides the stored option and always groups afresh. Grouped
+        conversations are not stored on the parser, and each one's messages
+        are only built when it is yielded.
         
-        for i, message in enumerate(sorted_messages):
-            # Skip messages without content
-            if 'content' not in message:
-                continue
+        Args:
+            time_threshold_seconds: Maximum time difference in seconds for grouping (default: 30)
+            interchange_only: If True, only include conversations with at least 2 different senders (default: True)
+            max_messages: Maximum number of messages per conversation (default: 10)
+            group_consecutive: If True, group consecutive messages from the same sender (default: False)
+            consecutive_separator: Separator for grouped consecutive messages (default: ', ')
+            
+        Returns:
+            Iterator over conversations in chronological order, each a list of messages
+        """
+        overrides = {
+            'time_threshold_seconds': time_threshold_seconds,
+            'interchange_only': interchange_only,
+            'max_messages': max_messages,
+            'group_consecutive': group_consecutive,
+            'consecutive_separator': consecutive_separator,
+        }
+        overrides = {key: value for key, value in overrides.items() if value is not None}
+        if self._conversations_stored and not overrides:
+            return iter(self.conversations)
+        return self._generate_conversations(**{**self._parse_options, **overrides})
+    
+    def _generate_conversations(self, time_threshold_seconds: int = 30,
+                                interchange_only: bool = True,
+                                max_messages: int = 10,
+                                group_consecutive: bool = False,
+                                consecutive_separator: str = ', ') -> Iterator[List[Dict[str, Any]]]:
+        """
+        Group the loaded messages and yield conversations one at a time.
+        
+        Args:
+            time_threshold_seconds: Maximum time difference in seconds for grouping (default: 30)
+            interchange_only: If True, only include conversations with at least 2 different senders (default: True)
+            max_messages: Maximum number of messages per conversation (default: 10)
+            group_consecutive: If True, group consecutive messages from the same sender (default: False)
+            consecutive_separator: Separator for grouped consecutive messages (default: ', ')
+            
+        Yields:
+            Conversations in chronological order, each a list of messages
+        """
+        if not self.messages_data:
+            return
+        
+        # Drop messages without content (reactions, calls, media-only) up front,
+        # so neither the sort nor the per-message loop below has to visit them
+        messages = [
+            msg for msg in self.messages_data.get('messages', [])
+            if msg.get('content') is not None
+        ]
+        
+        # Sort messages by timestamp (oldest first for chronological order).
+        # Argsort over a precomputed key list avoids a Python call per message;
+        # the sort is stable, so ties keep their load order.
+        sort_keys = [msg.get('timestamp_ms', 0) for msg in messages]
+        order = sorted(range(len(messages)), key=sort_keys.__getitem__)
+        
+        if not order:
+            return
+        
+        # Processed messages are kept as parallel columns; message dicts are
+        # only built for conversations that are emitted
+        senders = []
+        contents = []
+        timestamps = []
+        resolved_usernames = self._resolved_usernames
+        
+        for i in order:
+            message = messages[i]
+            content_raw = message['content']
             
             # Create processed message with attachment handling
-            sender = self._replace_username(message.get('sender_name', ''))
-            content_raw = message.get('content', '')
+            # Resolve through the cache inline; only unseen senders pay a call
+            sender_name = message.get('sender_name', '')
+            sender = resolved_usernames.get(sender_name)
+            if sender is None:
+                sender = self._replace_username(sender_name)
             share_text = None
             if isinstance(message.get('share'), dict):
                 share_text = message['share'].get('share_text')
 
-            # Replace Instagram's generic attachment placeholder with a readable marker
-            if content_raw.strip().lower() == 'enviaste un archivo adjunto.':
+            # Replace Instagram's generic attachment placeholder with a readable marker.
+            # Longer contents can only match if padded with whitespace, so most
+            # messages skip the strip/lower allocations entirely.
+            if ((len(content_raw) <= _ATTACHMENT_MARKER_MAX_LEN
+                    or content_raw[0].isspace() or content_raw[-1].isspace())
+                    and content_raw.strip().lower() in _ATTACHMENT_MARKERS):
                 if share_text and share_text.strip():
                     content = f"[image from {sender}: {share_text.strip()}]"
                 else:
@@ -199,67 +513,46 @@ class MessageParser:
             else:
                 content = content_raw
 
-            processed_msg = {
-                'sender': sender,
-                'content': content,
-                'timestamp_ms': message.get('timestamp_ms', 0),
-                'timestamp': datetime.fromtimestamp(
-                    message.get('timestamp_ms', 0) / 1000.0
-                ).isoformat() if message.get('timestamp_ms') else None
-            }
-            
-            # First message starts a new conversation
-            if not current_conversation:
-                current_conversation.append(processed_msg)
-            else:
-                # Check if we've reached the maximum messages limit
-                if len(current_conversation) >= max_messages:
-                    # Save current conversation if it meets the criteria
-                    if self._is_valid_conversation(current_conversation, interchange_only):
-                        conversations.append(current_conversation)
-                    current_conversation = [processed_msg]
-                else:
-                    # Check if this message should be in the same conversation
-                    last_msg = current_conversation[-1]
-                    if self._should_group_messages(last_msg, processed_msg, time_threshold_seconds, current_conversation):
-                        current_conversation.append(processed_msg)
-                    else:
-                        # Save current conversation if it meets the criteria
-                        if current_conversation:
-                            if self._is_valid_conversation(current_conversation, interchange_only):
-                                conversations.append(current_conversation)
-                        current_conversation = [processed_msg]
-        
-        # Add the last conversation if it meets the criteria
-        if current_conversation:
-            if self._is_valid_conversation(current_conversation, interchange_only):
-                conversations.append(current_conversation)
-        
-        # Group consecutive messages from the same sender if requested
-        if group_consecutive:
-            conversations = [self._group_consecutive_messages(conv, consecutive_separator) for conv in conversations]
-        
-        self.conversations = conversations
-        return conversations
+            senders.append(sender)
+            contents.append(content)
+            timestamps.append(sort_keys[i])
+        
+        # Intern senders as small ints so the boundary scan compares ints only
+        sender_index = {}
+        sender_ids = [sender_index.setdefault(sender, len(sender_index)) for sender in senders]
+        
+        spans = self._find_conversation_spans(timestamps, sender_ids, time_threshold_seconds,
+                                              interchange_only, max_messages)
+        for span in spans:
+            conversation = self._build_conversation(senders, contents, timestamps, span)
+            # Group consecutive messages from the same sender if requested
+            if group_consecutive:
+                conversation = self._group_consecutive_messages(conversation, consecutive_separator)
+            yield conversation
     
-    def _is_valid_conversation(self, conversation: List[Dict[str, Any]], 
-                              interchange_only: bool) -> bool:
+    def _build_conversation(self, senders: List[str], contents: List[str],
+                            timestamps: List[int], span: slice) -> List[Dict[str, Any]]:
         """
-        Check if a conversation is valid based on interchange criteria.
+        Build the message dicts for one conversation from the message columns.
         
         Args:
-            conversation: List of messages in the conversation
-            interchange_only: If True, require at least 2 different senders
+            senders: Sender label of each processed message
+            contents: Content of each processed message
+            timestamps: Timestamp in milliseconds of each processed message
+            span: Slice selecting the conversation's messages
             
         Returns:
-            True if the conversation is valid, False otherwise
+            List of messages in the conversation
         """
-        if not interchange_only:
-            return True
-        
-        # Check if there are at least 2 different senders
-        senders = set(msg['sender'] for msg in conversation)
-        return len(senders) >= 2
+        return [
+            {
+                'sender': sender,
+                'content': content,
+                'timestamp_ms': timestamp_ms,
+                'timestamp': self._format_timestamp(timestamp_ms)
+            }
+            for sender, content, timestamp_ms in zip(senders[span], contents[span], timestamps[span])
+        ]
     
     def _group_consecutive_messages(self, conversation: List[Dict[str, Any]], 
                                    separator: str = ', ') -> List[Dict[str, Any]]:
@@ -278,24 +571,30 @@ class MessageParser:
         
         grouped = []
         current_group = None
+        # Contents of the current group, joined once when the group is closed
+        current_contents = []
         
         for msg in conversation:
             if current_group is None:
                 # Start first group
                 current_group = msg.copy()
+                current_contents = [msg['content']]
             elif current_group['sender'] == msg['sender']:
-                # Same sender - append content to current group
-                current_group['content'] += separator + msg['content']
+                # Same sender - collect content for the current group
+                current_contents.append(msg['content'])
                 # Update timestamp to the latest one
                 current_group['timestamp_ms'] = msg['timestamp_ms']
                 current_group['timestamp'] = msg['timestamp']
             else:
                 # Different sender - save current group and start new one
+                current_group['content'] = separator.join(current_contents)
                 grouped.append(current_group)
                 current_group = msg.copy()
+                current_contents = [msg['content']]
         
         # Add the last group
         if current_group is not None:
+            current_group['content'] = separator.join(current_contents)
             grouped.append(current_group)
         
         return grouped
@@ -304,10 +603,15 @@ class MessageParser:
         """
         Get parsed conversations.
         
+        Returns the list stored by parse_conversations, or groups the loaded
+        messages into a new list when conversations are produced lazily.
+        
         Returns:
             List of conversations
         """
-        return self.conversations
+        if self._conversations_stored:
+            return self.conversations
+        return list(self.iter_conversations())
     
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -327,13 +631,15 @@ class MessageParser:
         
         # Get unique participants from conversations
         participants = set()
-        for conv in self.conversations:
+        total_conversations = 0
+        for conv in self.iter_conversations():
+            total_conversations += 1
             for msg in conv:
                 participants.add(msg['sender'])
         
         return {
             'total_messages': total_messages,
             'messages_with_content': messages_with_content,
-            'total_conversations': len(self.conversations),
+            'total_conversations': total_conversations,
             'participants': list(participants)
         }
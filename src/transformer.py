@@ -2,10 +2,183 @@
 Transformer for converting Instagram messages to LLM training format.
 Uses the MessageParser to transform messages into training data.
 """
+import asyncio
+import io
 import json
-from typing import Dict, List, Any, Optional
+import json.encoder
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Any, Optional
 from .parser import MessageParser
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; fall back to the stdlib
+    orjson = None
+
+# Write buffer size for output files
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Block size that O_DIRECT writes are padded to
+_DIRECT_IO_ALIGNMENT = 4096
+
+# Serialized output collected before each write call in save_all
+_WRITE_BATCH_SIZE = 4 << 20
+
+# Below this many conversations, process start-up outweighs parallel gains
+_PARALLEL_MIN_CONVERSATIONS = 1000
+
+# Bytes serialized per write in save_to_file_async, and how many serialized
+# batches may wait for the writer before serialization pauses
+_ASYNC_BATCH_SIZE = 256 * 1024
+_ASYNC_QUEUE_SIZE = 64
+
+
+# The stdlib's escaper for ensure_ascii=False strings (the C version when
+# available), called directly to skip JSONEncoder's per-call type dispatch
+_encode_basestring = json.encoder.encode_basestring
+
+
+def _encode_string(value: str) -> bytes:
+    """
+    Serialize a single string to UTF-8 encoded JSON.
+    
+    Uses orjson when it is installed and the standard library otherwise; both
+    produce the same output as json.dumps(value, ensure_ascii=False).
+    
+    Args:
+        value: String to serialize
+        
+    Returns:
+        Quoted and escaped JSON string as UTF-8 bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return _encode_basestring(value).encode('utf-8')
+
+
+class _DirectWriter(io.RawIOBase):
+    """
+    Binary file writer that bypasses the page cache with O_DIRECT.
+    
+    Data is copied into a page-aligned anonymous mmap buffer and written in
+    full _WRITE_BUFFER_SIZE blocks. On close the last block is padded to a
+    multiple of _DIRECT_IO_ALIGNMENT and the file is truncated back to the
+    number of bytes actually written.
+    """
+    
+    def __init__(self, fd: int):
+        """
+        Initialize the writer.
+        
+        Args:
+            fd: File descriptor opened with O_DIRECT for writing
+        """
+        super().__init__()
+        self._fd = fd
+        self._buffer = mmap.mmap(-1, _WRITE_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._used = 0
+        self._size = 0
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        data = memoryview(data).cast('B')
+        total = len(data)
+        while data:
+            count = min(len(data), _WRITE_BUFFER_SIZE - self._used)
+            self._view[self._used:self._used + count] = data[:count]
+            self._used += count
+            data = data[count:]
+            if self._used == _WRITE_BUFFER_SIZE:
+                self._flush_block(_WRITE_BUFFER_SIZE)
+        self._size += total
+        return total
+    
+    def _flush_block(self, length: int) -> None:
+        """Write the first length bytes of the buffer, which must be aligned."""
+        block = self._view[:length]
+        while block:
+            block = block[os.write(self._fd, block):]
+        self._used = 0
+    
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self._used:
+                padded = -(-self._used // _DIRECT_IO_ALIGNMENT) * _DIRECT_IO_ALIGNMENT
+                self._view[self._used:padded] = bytes(padded - self._used)
+                self._flush_block(padded)
+            os.ftruncate(self._fd, self._size)
+        finally:
+            self._view.release()
+            self._buffer.close()
+            os.close(self._fd)
+            super().close()
+
+
+def _open_output(path: str, text: bool = False, direct_io: bool = False):
+    """
+    Open an output file for writing.
+    
+    With direct_io the file is opened with O_DIRECT where the platform and
+    file system support it; otherwise, or when O_DIRECT is refused, a regular
+    buffered file is returned.
+    
+    Args:
+        path: Path to the output file
+        text: If True, return a UTF-8 text file instead of a binary one
+        direct_io: If True, try to bypass the page cache
+        
+    Returns:
+        Writable file object
+    """
+    if direct_io and hasattr(os, 'O_DIRECT'):
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o666)
+        except OSError:
+            # e.g. tmpfs rejects O_DIRECT with EINVAL
+            pass
+        else:
+            writer = _DirectWriter(fd)
+            if text:
+                return io.TextIOWrapper(writer, encoding='utf-8', write_through=True)
+            return writer
+    if text:
+        return open(path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE)
+    return open(path, 'wb', buffering=_WRITE_BUFFER_SIZE)
+
+
+def _chunk_to_chatml(chunk: List[List[Dict[str, Any]]],
+                     roles: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Convert a chunk of conversations to ChatML format in a worker process.
+    
+    Defined at module level so ProcessPoolExecutor can pickle it.
+    
+    Args:
+        chunk: Conversations to convert
+        roles: LLM role for every sender in the chunk
+        
+    Returns:
+        Conversation objects in ChatML format, in input order
+    """
+    chatml_data = []
+    for conversation in chunk:
+        messages = [
+            {'role': roles[msg['sender']], 'content': msg['content']}
+            for msg in conversation if msg['content']
+        ]
+        if messages:
+            chatml_data.append({'messages': messages})
+    return chatml_data
+
 
 class MessageTransformer:
     """
@@ -24,6 +197,12 @@ class MessageTransformer:
         """
         self.user_mapping = self._load_user_mapping(user_mapping_file)
         self.parser = MessageParser(self.user_mapping)
+        # Sender label -> LLM role, filled in as senders are seen
+        self._role_by_sender = {}
+        # Sender label -> serialized JSONL message prefix for its role
+        self._jsonl_prefix_by_sender = {}
+        # Sender label -> serialized indented ChatML message prefix for its role
+        self._indented_prefix_by_sender = {}
         
     def _load_user_mapping(self, filepath: str) -> Dict[str, str]:
         """
@@ -47,7 +226,8 @@ class MessageTransformer:
     
     def load_and_parse(self, messages_file: str, time_threshold_seconds: int = 30, 
                       interchange_only: bool = True, max_messages: int = 10,
-                      group_consecutive: bool = False, consecutive_separator: str = ', ') -> None:
+                      group_consecutive: bool = False, consecutive_separator: str = ', ',
+                      stream: bool = False) -> None:
         """
         Load messages and parse into conversations.
         
@@ -58,14 +238,24 @@ class MessageTransformer:
             max_messages: Maximum number of messages per conversation (default: 10)
             group_consecutive: If True, group consecutive messages from the same sender (default: False)
             consecutive_separator: Separator for grouped consecutive messages (default: ', ')
+            stream: If True, read the input one message at a time, keeping only
+                    the fields needed for parsing, and group conversations as
+                    they are converted instead of storing them; recommended
+                    for large exports, especially with ijson installed
+                    (default: False)
         """
-        self.parser.load_messages(messages_file)
-        self.parser.parse_conversations(time_threshold_seconds, interchange_only, max_messages, group_consecutive, consecutive_separator)
+        self.parser.load_messages(messages_file, stream=stream)
+        if stream:
+            self.parser.set_parse_options(time_threshold_seconds, interchange_only, max_messages, group_consecutive, consecutive_separator)
+        else:
+            self.parser.parse_conversations(time_threshold_seconds, interchange_only, max_messages, group_consecutive, consecutive_separator)
     
-    def to_chatml_format(self) -> List[Dict[str, Any]]:
+    def to_chatml_format(self, workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Convert conversations to ChatML format for LLM training.
         
+        Messages with empty content are left out.
+        
         ChatML format example:
         {
             "messages": [
@@ -74,26 +264,82 @@ class MessageTransformer:
             ]
         }
         
+        Args:
+            workers: Number of worker processes to convert with. Only used
+                     for datasets with more than 1000 conversations; by
+                     default conversion runs in this process.
+        
         Returns:
             List of conversation objects in ChatML format
         """
+        if not workers or workers < 2:
+            return list(self._iter_chatml())
         conversations = self.parser.get_conversations()
+        if len(conversations) <= _PARALLEL_MIN_CONVERSATIONS:
+            return list(self._iter_chatml())
+        
+        # Resolve roles here so workers only do lookups and custom
+        # _map_sender_to_role overrides still apply
+        roles = self._map_senders_to_roles(
+            {msg['sender'] for conversation in conversations for msg in conversation}
+        )
+        
+        chunk_size = -(-len(conversations) // workers)
+        chunks = [conversations[i:i + chunk_size] for i in range(0, len(conversations), chunk_size)]
         chatml_data = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_data in executor.map(_chunk_to_chatml, chunks, [roles] * len(chunks)):
+                chatml_data.extend(chunk_data)
+        return chatml_data
+    
+    def _iter_chatml(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield conversations in ChatML format one at a time.
         
-        for conversation in conversations:
-            messages = []
-            for msg in conversation:
-                # Map sender to role (customize as needed)
-                role = self._map_sender_to_role(msg['sender'])
-                messages.append({
-                    'role': role,
-                    'content': msg['content']
-                })
-            
+        Yields:
+            Conversation objects in ChatML format
+        """
+        for messages in self._iter_content_conversations():
+            yield self._conversation_to_chatml(messages)
+    
+    def _iter_content_conversations(self) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield the messages with content of each conversation.
+        
+        Messages with empty content carry nothing to train on, so the ChatML
+        and JSONL outputs drop them before any role mapping or serialization;
+        conversations left without messages are skipped.
+        
+        Yields:
+            Lists of messages with non-empty content
+        """
+        for conversation in self.parser.iter_conversations():
+            messages = [msg for msg in conversation if msg['content']]
             if messages:
-                chatml_data.append({'messages': messages})
+                yield messages
+    
+    def _conversation_to_chatml(self, conversation: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Convert one conversation to a ChatML object.
         
-        return chatml_data
+        Args:
+            conversation: List of messages in the conversation
+            
+        Returns:
+            Conversation object in ChatML format
+        """
+        cached_role = self._role_by_sender.get
+        map_role = self._map_sender_to_role
+        # Map sender to role (customize as needed); known senders are
+        # resolved from the cache without a method call
+        messages = [
+            {
+                'role': cached_role(msg['sender']) or map_role(msg['sender']),
+                'content': msg['content']
+            }
+            for msg in conversation
+        ]
+        return {'messages': messages}
     
     def to_text_format(self, include_timestamp: bool = False) -> List[str]:
         """
@@ -105,30 +351,72 @@ class MessageTransformer:
         Returns:
             List of formatted conversation strings
         """
-        conversations = self.parser.get_conversations()
-        text_data = []
+        return list(self._iter_text(include_timestamp))
+    
+    def _iter_text(self, include_timestamp: bool = False) -> Iterator[str]:
+        """
+        Yield conversations in text format one at a time.
         
-        for i, conversation in enumerate(conversations):
-            lines = [f"=== Conversation {i+1} ==="]
-            for msg in conversation:
-                timestamp_str = f"[{msg['timestamp']}] " if include_timestamp and msg.get('timestamp') else ""
-                lines.append(f"{timestamp_str}{msg['sender']}: {msg['content']}")
-            lines.append("")  # Empty line between conversations
-            text_data.append('\n'.join(lines))
+        Args:
+            include_timestamp: Whether to include timestamps in output
+            
+        Yields:
+            Formatted conversation strings
+        """
+        for i, conversation in enumerate(self.parser.iter_conversations()):
+            yield self._conversation_to_text(i + 1, conversation, include_timestamp)
+    
+    def _conversation_to_text(self, number: int, conversation: List[Dict[str, Any]],
+                              include_timestamp: bool = False) -> str:
+        """
+        Format one conversation as text.
         
-        return text_data
+        Args:
+            number: Conversation number shown in the header
+            conversation: List of messages in the conversation
+            include_timestamp: Whether to include timestamps in output
+            
+        Returns:
+            Formatted conversation string
+        """
+        # Every line ends with a newline, which leaves an empty line
+        # between conversations once they are joined
+        header = f"=== Conversation {number} ===\n"
+        if not include_timestamp:
+            return header + ''.join([
+                f"{msg['sender']}: {msg['content']}\n" for msg in conversation
+            ])
+        return header + ''.join([
+            f"[{msg['timestamp']}] {msg['sender']}: {msg['content']}\n"
+            if msg.get('timestamp')
+            else f"{msg['sender']}: {msg['content']}\n"
+            for msg in conversation
+        ])
     
     def to_jsonl_format(self) -> List[str]:
         """
         Convert conversations to JSONL format (one JSON object per line).
         
-        Each line contains a conversation in ChatML format.
+        Each line contains a conversation in ChatML format, without messages
+        that have empty content.
         
         Returns:
             List of JSON strings, one per conversation
         """
-        chatml_data = self.to_chatml_format()
-        return [json.dumps(conv, ensure_ascii=False) for conv in chatml_data]
+        return list(self.iter_jsonl())
+    
+    def iter_jsonl(self) -> Iterator[str]:
+        """
+        Yield conversations as JSONL lines one at a time.
+        
+        Lines are produced as conversations are parsed, so only one line is
+        held in memory at a time unless the caller keeps them.
+        
+        Yields:
+            JSON strings in ChatML format, without the trailing newline
+        """
+        for messages in self._iter_content_conversations():
+            yield self._conversation_to_jsonl(messages).decode('utf-8')
     
     def _map_sender_to_role(self, sender: str) -> str:
         """
@@ -140,36 +428,303 @@ class MessageTransformer:
         Returns:
             LLM role ('user', 'assistant', or 'system')
         """
-        # Default mapping: 'user' role stays as 'user', others become 'assistant'
-        # Customize this based on your needs
-        if sender.lower() == 'user':
-            return 'assistant'
-        else:
-            return 'user'
+        role = self._role_by_sender.get(sender)
+        if role is None:
+            # Default mapping: 'user' role stays as 'user', others become 'assistant'
+            # Customize this based on your needs
+            if sender.lower() == 'user':
+                role = 'assistant'
+            else:
+                role = 'user'
+            self._role_by_sender[sender] = role
+        return role
     
-    def save_to_file(self, output_file: str, output_format: str = 'chatml') -> None:
+    def _map_senders_to_roles(self, senders: Iterable[str]) -> Dict[str, str]:
+        """
+        Map many senders to LLM roles at once.
+        
+        Each distinct sender is passed to _map_sender_to_role only once, so
+        callers can resolve a whole dataset up front and then use plain dict
+        lookups per message.
+        
+        Args:
+            senders: Sender names or roles, possibly repeated
+            
+        Returns:
+            Dictionary mapping each distinct sender to its LLM role
+        """
+        role_by_sender = self._role_by_sender
+        return {
+            sender: role_by_sender.get(sender) or self._map_sender_to_role(sender)
+            for sender in set(senders)
+        }
+    
+    def save_to_file(self, output_file: str, output_format: str = 'chatml',
+                     indent: bool = False, direct_io: bool = False) -> None:
         """
         Save transformed data to file.
         
         Args:
             output_file: Path to output file
             output_format: Output format ('chatml', 'text', 'jsonl')
+            indent: If True, pretty-print ChatML output with 2-space indentation
+                    instead of writing compact JSON (default: False)
+            direct_io: If True, write with O_DIRECT to bypass the page cache
+                       where supported (Linux); useful for multi-GB outputs
+                       (default: False)
         """
         if output_format == 'chatml':
-            data = self.to_chatml_format()
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False, separators=(',', ': '))
+            self.save_all(chatml_path=output_file, indent=indent, direct_io=direct_io)
         elif output_format == 'text':
-            data = self.to_text_format()
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(data))
+            self.save_all(text_path=output_file, direct_io=direct_io)
         elif output_format == 'jsonl':
-            data = self.to_jsonl_format()
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(data))
+            self.save_all(jsonl_path=output_file, direct_io=direct_io)
         else:
             raise ValueError(f"Unsupported format: {output_format}")
     
+    def save_all(self, chatml_path: Optional[str] = None, text_path: Optional[str] = None,
+                 jsonl_path: Optional[str] = None, include_timestamp: bool = False,
+                 indent: bool = False, direct_io: bool = False) -> None:
+        """
+        Save several output formats in a single pass over the conversations.
+        
+        Each conversation is serialized once and written to every requested
+        file before the next one is processed; compact ChatML entries and
+        JSONL lines share the same bytes. The files are identical to the ones
+        written by save_to_file for each format.
+        
+        Args:
+            chatml_path: Path to the ChatML output file, or None to skip it
+            text_path: Path to the text output file, or None to skip it
+            jsonl_path: Path to the JSONL output file, or None to skip it
+            include_timestamp: Whether to include timestamps in the text output
+            indent: If True, pretty-print ChatML output with 2-space indentation
+                    instead of writing compact JSON (default: False)
+            direct_io: If True, write with O_DIRECT to bypass the page cache
+                       where supported (Linux); useful for multi-GB outputs
+                       (default: False)
+        """
+        with ExitStack() as stack:
+            chatml_file = text_file = jsonl_file = None
+            if chatml_path is not None:
+                chatml_file = stack.enter_context(_open_output(chatml_path, direct_io=direct_io))
+            if text_path is not None:
+                text_file = stack.enter_context(_open_output(text_path, text=True, direct_io=direct_io))
+            if jsonl_path is not None:
+                jsonl_file = stack.enter_context(_open_output(jsonl_path, direct_io=direct_io))
+            
+            # Output is collected in memory and handed to each file in batches
+            # of about _WRITE_BATCH_SIZE, so there are few write calls
+            chatml_buf = bytearray()
+            jsonl_buf = bytearray()
+            text_parts = []
+            text_size = 0
+            
+            chatml_open, chatml_sep = (b'[\n  ', b',\n  ') if indent else (b'[', b',')
+            written = 0
+            for i, conversation in enumerate(self.parser.iter_conversations()):
+                if text_file is not None:
+                    if i:
+                        text_parts.append('\n')
+                    text = self._conversation_to_text(i + 1, conversation, include_timestamp)
+                    text_parts.append(text)
+                    text_size += len(text)
+                    if text_size >= _WRITE_BATCH_SIZE:
+                        text_file.write(''.join(text_parts))
+                        text_parts = []
+                        text_size = 0
+                if chatml_file is None and jsonl_file is None:
+                    continue
+                # Same filter as _iter_content_conversations
+                messages = [msg for msg in conversation if msg['content']]
+                if not messages:
+                    continue
+                
+                line = None
+                if jsonl_file is not None or not indent:
+                    line = self._conversation_to_jsonl(messages)
+                if jsonl_file is not None:
+                    if written:
+                        jsonl_buf += b'\n'
+                    jsonl_buf += line
+                    if len(jsonl_buf) >= _WRITE_BATCH_SIZE:
+                        jsonl_file.write(jsonl_buf)
+                        jsonl_buf.clear()
+                if chatml_file is not None:
+                    chatml_buf += chatml_sep if written else chatml_open
+                    if indent:
+                        chatml_buf += self._conversation_to_indented_chatml(messages)
+                    else:
+                        chatml_buf += line
+                    if len(chatml_buf) >= _WRITE_BATCH_SIZE:
+                        chatml_file.write(chatml_buf)
+                        chatml_buf.clear()
+                written += 1
+            
+            if chatml_file is not None:
+                if not written:
+                    chatml_buf += b'[]'
+                else:
+                    chatml_buf += b'\n]' if indent else b']'
+                chatml_file.write(chatml_buf)
+            if jsonl_file is not None:
+                jsonl_file.write(jsonl_buf)
+            if text_file is not None:
+                text_file.write(''.join(text_parts))
+    
+    async def save_to_file_async(self, output_file: str, output_format: str = 'chatml',
+                                 indent: bool = False) -> None:
+        """
+        Save transformed data to file from a coroutine.
+        
+        Conversations are serialized in the event loop while the previous
+        batches are written to disk by a worker thread, so encoding overlaps
+        with the writes. The file is identical to the one written by
+        save_to_file.
+        
+        Args:
+            output_file: Path to output file
+            output_format: Output format ('chatml', 'text', 'jsonl')
+            indent: If True, pretty-print ChatML output with 2-space indentation
+                    instead of writing compact JSON (default: False)
+        """
+        if output_format not in ('chatml', 'text', 'jsonl'):
+            raise ValueError(f"Unsupported format: {output_format}")
+        
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=_ASYNC_QUEUE_SIZE)
+        
+        async def produce():
+            batch = []
+            size = 0
+            for chunk in self._iter_output_bytes(output_format, indent):
+                batch.append(chunk)
+                size += len(chunk)
+                if size >= _ASYNC_BATCH_SIZE:
+                    await queue.put(b''.join(batch))
+                    batch = []
+                    size = 0
+                    # Give the writer a chance to start on the batch
+                    await asyncio.sleep(0)
+            if batch:
+                await queue.put(b''.join(batch))
+            await queue.put(None)
+        
+        async def consume(f):
+            while True:
+                data = await queue.get()
+                if data is None:
+                    return
+                await loop.run_in_executor(None, f.write, data)
+        
+        f = await loop.run_in_executor(None, partial(open, output_file, 'wb'))
+        try:
+            tasks = [asyncio.ensure_future(produce()), asyncio.ensure_future(consume(f))]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # Stop the other side if either one failed
+                for task in tasks:
+                    task.cancel()
+        finally:
+            await loop.run_in_executor(None, f.close)
+    
+    def _iter_output_bytes(self, output_format: str, indent: bool = False) -> Iterator[bytes]:
+        """
+        Yield the contents of a save_to_file output file piece by piece.
+        
+        Args:
+            output_format: Output format ('chatml', 'text', 'jsonl')
+            indent: If True, pretty-print ChatML output with 2-space indentation
+            
+        Yields:
+            Consecutive pieces of the file as UTF-8 bytes
+        """
+        if output_format == 'text':
+            for i, conversation in enumerate(self.parser.iter_conversations()):
+                if i:
+                    yield b'\n'
+                yield self._conversation_to_text(i + 1, conversation).encode('utf-8')
+            return
+        
+        if output_format == 'chatml':
+            opening, separator = (b'[\n  ', b',\n  ') if indent else (b'[', b',')
+        else:
+            opening, separator = b'', b'\n'
+        written = False
+        for messages in self._iter_content_conversations():
+            yield separator if written else opening
+            if output_format == 'chatml' and indent:
+                yield self._conversation_to_indented_chatml(messages)
+            else:
+                yield self._conversation_to_jsonl(messages)
+            written = True
+        if output_format == 'chatml':
+            if not written:
+                yield b'[]'
+            else:
+                yield b'\n]' if indent else b']'
+    
+    def _conversation_to_jsonl(self, conversation: List[Dict[str, Any]]) -> bytes:
+        """
+        Serialize one conversation as a compact ChatML JSON line.
+        
+        The JSON is assembled from each message's role and content directly,
+        without building the intermediate ChatML dicts. The serialized
+        '{"role": ..., "content":' prefix is cached per sender, so only the
+        content is encoded per message. The result is identical to
+        serializing the to_chatml_format() entry.
+        
+        Args:
+            conversation: List of messages in the conversation
+            
+        Returns:
+            JSON line as UTF-8 bytes, without the trailing newline
+        """
+        prefixes = self._jsonl_prefix_by_sender
+        cached_prefix = prefixes.get
+        encode = _encode_string
+        parts = []
+        append = parts.append
+        for msg in conversation:
+            sender = msg['sender']
+            prefix = cached_prefix(sender)
+            if prefix is None:
+                role = self._role_by_sender.get(sender) or self._map_sender_to_role(sender)
+                prefix = prefixes[sender] = b'{"role":' + encode(role) + b',"content":'
+            append(prefix + encode(msg['content']) + b'}')
+        return b'{"messages":[' + b','.join(parts) + b']}'
+    
+    def _conversation_to_indented_chatml(self, conversation: List[Dict[str, Any]]) -> bytes:
+        """
+        Serialize one conversation as a pretty-printed ChatML array entry.
+        
+        Like _conversation_to_jsonl, the JSON is assembled directly from
+        cached per-sender prefixes and the encoded contents. The layout is
+        json.dumps(indent=2) of the to_chatml_format() entry nested one level
+        inside the output array, starting after the array's own indentation.
+        
+        Args:
+            conversation: List of messages in the conversation
+            
+        Returns:
+            Indented JSON object as UTF-8 bytes
+        """
+        prefixes = self._indented_prefix_by_sender
+        cached_prefix = prefixes.get
+        encode = _encode_string
+        parts = []
+        append = parts.append
+        for msg in conversation:
+            sender = msg['sender']
+            prefix = cached_prefix(sender)
+            if prefix is None:
+                role = self._role_by_sender.get(sender) or self._map_sender_to_role(sender)
+                prefix = prefixes[sender] = (b'{\n        "role": ' + encode(role)
+                                             + b',\n        "content": ')
+            append(prefix + encode(msg['content']) + b'\n      }')
+        return b'{\n    "messages": [\n      ' + b',\n      '.join(parts) + b'\n    ]\n  }'
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about the transformed data.
@@ -197,10 +752,12 @@ def main():
     print(f"  Messages with content: {stats.get('messages_with_content', 0)}")
     print(f"  Total conversations: {stats.get('total_conversations', 0)}")
     
-    # Save in different formats
-    transformer.save_to_file('output_chatml.json', output_format='chatml')
-    transformer.save_to_file('output_text.txt', output_format='text')
-    transformer.save_to_file('output.jsonl', output_format='jsonl')
+    # Save in different formats with a single pass over the conversations
+    transformer.save_all(
+        chatml_path='output_chatml.json',
+        text_path='output_text.txt',
+        jsonl_path='output.jsonl'
+    )
     
     print("\nOutput files created:")
     print("  - output_chatml.json (ChatML format for LLM training)")
@@ -1,6 +1,7 @@
 """
 Simple tests for the parser and transformer.
 """
+import asyncio
 import json
 import os
 import sys
@@ -139,6 +140,140 @@ def test_conversation_grouping():
     return True
 
 
+def test_iter_conversations():
+    """Test lazy conversation iteration."""
+    print("Testing lazy conversation iteration...")
+    
+    user_mapping = {"user": "User Name", "friend": "Other Person"}
+    
+    parser = MessageParser(user_mapping)
+    parser.load_messages('data/messages.json.example')
+    
+    # The generator groups exactly like parse_conversations
+    iterated = list(parser.iter_conversations(time_threshold_seconds=30))
+    assert parser.conversations == [], "iter_conversations should not store conversations"
+    parsed = parser.parse_conversations(time_threshold_seconds=30)
+    assert iterated == parsed, "iter_conversations should match parse_conversations"
+    print(f"  ✓ iter_conversations yields {len(iterated)} conversation(s) matching parse_conversations")
+    
+    # Lazily grouped conversations use the options set up front
+    lazy = MessageParser(user_mapping)
+    lazy.load_messages('data/messages.json.example')
+    lazy.set_parse_options(time_threshold_seconds=30)
+    assert list(lazy.iter_conversations()) == parsed, "Lazy grouping should match parse_conversations"
+    assert lazy.conversations == [], "Lazy grouping should not store conversations"
+    assert lazy.get_conversations() == parsed, "get_conversations should group lazily"
+    print("  ✓ Lazy grouping matches parse_conversations")
+    
+    print("✅ Lazy conversation iteration tests passed!\n")
+    return True
+
+
+def test_streaming_load():
+    """Test loading messages one at a time."""
+    print("Testing streaming load...")
+    
+    user_mapping = {"user": "User Name", "friend": "Other Person"}
+    
+    parser = MessageParser(user_mapping)
+    parser.load_messages('data/messages.json.example')
+    expected = parser.parse_conversations(time_threshold_seconds=30)
+    
+    streamed = MessageParser(user_mapping)
+    streamed.load_messages('data/messages.json.example', stream=True)
+    assert len(streamed.messages_data['messages']) == len(parser.messages_data['messages']), \
+        "Streaming should keep every message"
+    assert streamed.parse_conversations(time_threshold_seconds=30) == expected, \
+        "Streaming should produce the same conversations"
+    print(f"  ✓ Streamed load produces the same {len(expected)} conversation(s)")
+    
+    print("✅ Streaming load tests passed!\n")
+    return True
+
+
+def test_async_save():
+    """Test saving files from a coroutine."""
+    print("Testing async file output...")
+    
+    with open('test_users.json', 'w') as f:
+        json.dump({"user": "User Name", "friend": "Other Person"}, f)
+    
+    transformer = MessageTransformer('test_users.json')
+    transformer.load_and_parse('data/messages.json.example', time_threshold_seconds=30)
+    
+    for output_format in ('chatml', 'text', 'jsonl'):
+        transformer.save_to_file('test_output_sync', output_format=output_format)
+        asyncio.run(transformer.save_to_file_async('test_output_async', output_format=output_format))
+        with open('test_output_sync', 'rb') as f_sync, open('test_output_async', 'rb') as f_async:
+            assert f_sync.read() == f_async.read(), f"Async {output_format} output should match save_to_file"
+        print(f"  ✓ Async {output_format} output matches save_to_file")
+    
+    # Cleanup test files
+    os.remove('test_users.json')
+    os.remove('test_output_sync')
+    os.remove('test_output_async')
+    
+    print("✅ Async file output tests passed!\n")
+    return True
+
+
+def test_direct_io_save():
+    """Test saving files with O_DIRECT writes."""
+    print("Testing direct I/O file output...")
+    
+    with open('test_users.json', 'w') as f:
+        json.dump({"user": "User Name", "friend": "Other Person"}, f)
+    
+    transformer = MessageTransformer('test_users.json')
+    transformer.load_and_parse('data/messages.json.example', time_threshold_seconds=30)
+    
+    for output_format in ('chatml', 'text', 'jsonl'):
+        transformer.save_to_file('test_output_buffered', output_format=output_format)
+        transformer.save_to_file('test_output_direct', output_format=output_format, direct_io=True)
+        with open('test_output_buffered', 'rb') as f_buffered, open('test_output_direct', 'rb') as f_direct:
+            assert f_buffered.read() == f_direct.read(), f"Direct I/O {output_format} output should match save_to_file"
+        print(f"  ✓ Direct I/O {output_format} output matches save_to_file")
+    
+    # Cleanup test files
+    os.remove('test_users.json')
+    os.remove('test_output_buffered')
+    os.remove('test_output_direct')
+    
+    print("✅ Direct I/O file output tests passed!\n")
+    return True
+
+
+def test_empty_content_skipped():
+    """Test that messages with empty content are left out of training data."""
+    print("Testing empty content filtering...")
+    
+    with open('test_users.json', 'w') as f:
+        json.dump({"user": "User Name"}, f)
+    with open('test_messages.json', 'w') as f:
+        json.dump({'messages': [
+            {'sender_name': 'Other Person', 'timestamp_ms': 1000, 'content': 'Hello!'},
+            {'sender_name': 'User Name', 'timestamp_ms': 2000, 'content': ''},
+            {'sender_name': 'User Name', 'timestamp_ms': 3000, 'content': 'Hi there!'},
+        ]}, f)
+    
+    transformer = MessageTransformer('test_users.json')
+    transformer.load_and_parse('test_messages.json')
+    
+    chatml_data = transformer.to_chatml_format()
+    contents = [msg['content'] for msg in chatml_data[0]['messages']]
+    assert contents == ['Hello!', 'Hi there!'], "Empty messages should be skipped in ChatML"
+    assert [json.loads(line) for line in transformer.to_jsonl_format()] == chatml_data, \
+        "JSONL should skip the same messages"
+    print("  ✓ Empty messages are skipped in ChatML and JSONL")
+    
+    # Cleanup test files
+    os.remove('test_users.json')
+    os.remove('test_messages.json')
+    
+    print("✅ Empty content filtering tests passed!\n")
+    return True
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -149,6 +284,11 @@ def main():
         test_parser()
         test_transformer()
         test_conversation_grouping()
+        test_iter_conversations()
+        test_streaming_load()
+        test_async_save()
+        test_direct_io_save()
+        test_empty_content_skipped()
         
         print("=" * 60)
         print("✅ All tests passed successfully!")